@@ -29,7 +29,7 @@ def setup(base_url=None, skip_ws=False, perp_dexs=None):
         url = info.base_url.split(".", 1)[1]
         error_string = f"No accountValue:\nIf you think this is a mistake, make sure that {address} has a balance on {url}.\nIf address shown is your API wallet address, update the config to specify the address of your account, not the address of the API wallet."
         raise Exception(error_string)
-    exchange = Exchange(account, base_url, account_address=address, perp_dexs=perp_dexs)
+    exchange = Exchange(account, base_url, account_address=address, perp_dexs=perp_dexs, session=info.session)
     return address, info, exchange
 
 
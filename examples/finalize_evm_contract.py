@@ -2,25 +2,28 @@
 Script to finalize EVM contract linking with HyperCore spot token.
 This only performs the finalizeEvmContract action - assumes everything else is already set up.
 """
+import argparse
+import asyncio
+import functools
 import json
 import os
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, TypedDict, Union
+from typing import Any, Dict, List, Literal, Tuple, TypedDict, Union
 
 import requests
 from dotenv import load_dotenv
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
+from eth_utils import keccak, to_hex
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hyperliquid.utils import constants
 from hyperliquid.utils.signing import get_timestamp_ms, sign_l1_action
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent / ".env"
-if not env_path.exists():
-    env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path)
-
 
 class CreateInputParams(TypedDict):
     nonce: int
@@ -43,9 +46,12 @@ class FinalizeEvmContractAction(TypedDict):
     input: FinalizeEvmContractInput
 
 
+# Storage slot read for "customStorageSlot", computed once at import
+HYPERCORE_DEPLOYER_SLOT = keccak(b"HyperCore deployer")
+
+
 # Configuration
-TOKEN = int(os.getenv("TOKEN_INDEX",'0'))  # Your token index
-PRIVATE_KEY = os.getenv("PRIVATE_KEY", "0xPRIVATE_KEY")  # From .env file or env var
+# TOKEN_INDEX (your token index) and PRIVATE_KEY are read from the .env file or env vars when main() runs
 
 # Storage slot options - set ONE of these:
 # Option 1: Use first storage slot
@@ -59,6 +65,10 @@ DEPLOY_NONCE = 0  # Set this to your contract's creation nonce
 # This uses the slot at keccak256("HyperCore deployer") which must store the finalizer address
 USE_CUSTOM_STORAGE_SLOT = True
 
+# Additional tokens to finalize in the same run, as (token index, input) pairs.
+# e.g. [(1234, "customStorageSlot"), (1235, {"create": {"nonce": 7}})]
+EXTRA_TOKENS: List[Tuple[int, FinalizeEvmContractInput]] = []
+
 # Dry run mode
 DRY_RUN = False  # Set to False to actually send
 
@@ -66,159 +76,255 @@ DRY_RUN = False  # Set to False to actually send
 USE_MAINNET = False
 API_URL = constants.MAINNET_API_URL if USE_MAINNET else constants.TESTNET_API_URL
 
+# Maximum number of actions signed or submitted at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# Shared keep-alive session so repeated submissions reuse the TCP/TLS connection.
+# Only failed connection attempts are retried, since the request never reached the server. Read timeouts and
+# 5xx responses are not retried: the action may already have been accepted, and a resend would be rejected for
+# reusing its nonce, hiding the original outcome.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        max_retries=Retry(total=3, connect=3, read=False, backoff_factor=0.2),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    # Load environment variables from .env file, once per process and only when the script actually runs
+    env_path = Path(__file__).parent / ".env"
+    if not env_path.exists():
+        env_path = Path(__file__).parent.parent / ".env"
+    load_dotenv(env_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _account_from_key(private_key: str) -> LocalAccount:
+    # Deriving the key pair is a secp256k1 scalar multiplication, so do it once per key
+    account: LocalAccount = Account.from_key(private_key)
+    return account
+
+
+def describe_input(finalize_input: FinalizeEvmContractInput) -> str:
+    if finalize_input == "customStorageSlot":
+        return f"Custom storage slot (keccak256('HyperCore deployer') = {to_hex(HYPERCORE_DEPLOYER_SLOT)})"
+    elif finalize_input == "firstStorageSlot":
+        return "First storage slot"
+    return f"Deploy nonce: {finalize_input['create']['nonce']}"
+
 
-def main():
+def build_payload(account: LocalAccount, token: int, finalize_input: FinalizeEvmContractInput, nonce: int) -> Dict[str, Any]:
+    finalize_action: FinalizeEvmContractAction = {
+        "type": "finalizeEvmContract",
+        "token": token,
+        "input": finalize_input,
+    }
+    signature = sign_l1_action(account, finalize_action, None, nonce, None, USE_MAINNET)
+    return {
+        "action": finalize_action,
+        "nonce": nonce,
+        "signature": signature,
+        "vaultAddress": None,
+    }
+
+
+def post_payload(payload: Dict[str, Any]) -> requests.Response:
+    # Encode once, compactly, straight to the request body
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    response = _SESSION.post(API_URL + "/exchange", data=body, timeout=30)
+    response.raise_for_status()  # Raises an HTTPError for bad responses
+    return response
+
+
+def print_payload(payload: Dict[str, Any], storage_slot_info: str, debug: bool = False) -> None:
+    print("\n" + "="*80)
+    print("TRANSACTION DETAILS")
+    print("="*80)
+    print(f"API Endpoint: {API_URL}/exchange")
+    print(f"Token Index: {payload['action']['token']}")
+    print(f"Storage Slot Method: {storage_slot_info}")
+    print(f"Nonce: {payload['nonce']}")
+    if debug:
+        print("\nAction that will be sent:")
+        print(json.dumps(payload["action"], indent=2))
+        print("\nFull payload (signature truncated for display):")
+        payload_display = payload.copy()
+        if "signature" in payload_display:
+            sig = payload_display["signature"]
+            payload_display["signature"] = {
+                "r": sig["r"][:20] + "..." if len(sig["r"]) > 20 else sig["r"],
+                "s": sig["s"][:20] + "..." if len(sig["s"]) > 20 else sig["s"],
+                "v": sig["v"]
+            }
+        print(json.dumps(payload_display, indent=2))
+    print("="*80)
+    print("⚠️  WARNING: This action is IRREVERSIBLE!")
+    print("="*80)
+
+
+def report_result(token: int, future: "asyncio.Future[requests.Response]", verbose: bool = False) -> int:
+    print(f"\n📨 Token {token}:")
+    try:
+        response = future.result()
+        result = json.loads(response.content)
+        print("\n✅ Transaction submitted successfully!")
+        if verbose:
+            print("Response:")
+            print(json.dumps(result, indent=2))
+
+        # Check for errors in the response
+        status = result.get("status") if isinstance(result, dict) else None
+        if status == "ok":
+            print("\n✅ Status: OK - Transaction accepted")
+            if "response" in result:
+                response_data = result["response"]
+                if isinstance(response_data, dict) and "data" in response_data:
+                    response_data = response_data["data"]
+                print(f"Response data: {response_data}")
+        elif status == "err":
+            error_msg = result.get("response", "Unknown error")
+            print(f"\n❌ Status: ERROR - {error_msg}")
+            if isinstance(error_msg, dict) and "data" in error_msg:
+                print(f"Error details: {error_msg['data']}")
+            return 1
+        elif status is None:
+            print(f"\n⚠️  Unexpected response format: {result}")
+        else:
+            print(f"\n⚠️  Status: {status}")
+            if verbose:
+                print("Full response:", json.dumps(result, indent=2))
+
+    except requests.exceptions.Timeout:
+        print("\n❌ ERROR: Request timed out after 30 seconds")
+        print("The transaction may have been submitted. Check your account status.")
+        return 1
+    except requests.exceptions.HTTPError as e:
+        error_response = e.response
+        print(f"\n❌ HTTP ERROR: {e}")
+        if error_response is None:
+            return 1
+        print(f"Status code: {error_response.status_code}")
+        # Read the body once and only fall back to text if it is not JSON
+        body = error_response.content
+        try:
+            error_body = json.loads(body)
+            print(f"Error response: {json.dumps(error_body, indent=2)}")
+        except ValueError:
+            print(f"Error response (text): {body.decode('utf-8', 'replace')}")
+        return 1
+    except requests.exceptions.RequestException as e:
+        print(f"\n❌ REQUEST ERROR: {e}")
+        print("Failed to send transaction. Check your network connection and API endpoint.")
+        return 1
+    except Exception as e:
+        print(f"\n❌ UNEXPECTED ERROR: {type(e).__name__}: {e}")
+        if verbose:
+            sys.stderr.write(traceback.format_exc())
+        return 1
+
+    return 0
+
+
+async def finalize_all(
+    account: LocalAccount, finalize_requests: List[Tuple[int, FinalizeEvmContractInput]],
+    verbose: bool = False,
+    debug: bool = False,
+) -> int:
+    loop = asyncio.get_running_loop()
+    # One bounded pool runs both the CPU-bound signing and the blocking POSTs, capping concurrency at
+    # MAX_CONCURRENT_REQUESTS while the event loop overlaps the network round trips
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        # Sign every action up front so the sends can go out back to back
+        print(f"\n🔐 Signing {len(finalize_requests)} transaction(s)...")
+        try:
+            # Nonces must be unique per signer, so never reuse a millisecond timestamp
+            nonces: List[int] = []
+            for _ in finalize_requests:
+                nonces.append(max(get_timestamp_ms(), nonces[-1] + 1 if nonces else 0))
+            payloads = await asyncio.gather(
+                *[
+                    loop.run_in_executor(executor, build_payload, account, token, token_input, nonce)
+                    for (token, token_input), nonce in zip(finalize_requests, nonces)
+                ]
+            )
+            print("✅ Transaction signed successfully")
+        except Exception as e:
+            print(f"❌ ERROR: Failed to sign transaction: {type(e).__name__}: {e}")
+            if verbose:
+                sys.stderr.write(traceback.format_exc())
+            return 1
+
+        # Display what will be sent
+        for payload, (_, token_input) in zip(payloads, finalize_requests):
+            print_payload(payload, describe_input(token_input), debug)
+
+        if DRY_RUN:
+            print("\n🔍 DRY RUN MODE - Transaction NOT sent")
+            print("Set DRY_RUN = False to actually send this transaction")
+            return 0
+
+        print("\n📤 SENDING TRANSACTION...")
+        futures = [loop.run_in_executor(executor, post_payload, payload) for payload in payloads]
+        await asyncio.wait(futures)
+
+    return max(report_result(token, future, verbose) for (token, _), future in zip(finalize_requests, futures))
+
+
+def main(verbose: bool = False, debug: bool = False) -> int:
     print("="*80)
     print("FINALIZE EVM CONTRACT - HyperCore to HyperEVM Linking")
     print("="*80)
-    
+
+    _load_env()
+    token = int(os.environ.get("TOKEN_INDEX", "0"))
+    private_key = os.environ.get("PRIVATE_KEY", "0xPRIVATE_KEY")
+    verbose = verbose or os.environ.get("HL_VERBOSE", "").lower() in ("1", "true", "yes")
+
     # Validate configuration
-    if PRIVATE_KEY == "0xPRIVATE_KEY":
+    if private_key == "0xPRIVATE_KEY":
         print("❌ ERROR: Must set PRIVATE_KEY in .env file or environment variable")
         return 1
-    
+
     try:
-        account: LocalAccount = Account.from_key(PRIVATE_KEY)
+        account = _account_from_key(private_key)
     except Exception as e:
         print(f"❌ ERROR: Failed to load account from private key: {e}")
         return 1
-    
-    print(f"\n📋 Configuration:")
-    print(f"  Account: {account.address}")
-    print(f"  API URL: {API_URL}")
-    print(f"  Token Index: {TOKEN}")
-    print(f"  Network: {'Mainnet' if USE_MAINNET else 'Testnet'}")
-    print(f"  Mode: {'DRY RUN' if DRY_RUN else 'LIVE'}")
-    
+
     # Determine which storage slot method to use
-    finalize_action: FinalizeEvmContractAction
+    finalize_input: FinalizeEvmContractInput
     if USE_CUSTOM_STORAGE_SLOT:
-        finalize_action = {
-            "type": "finalizeEvmContract",
-            "token": TOKEN,
-            "input": "customStorageSlot",
-        }
-        storage_slot_info = "Custom storage slot (keccak256('HyperCore deployer'))"
+        finalize_input = "customStorageSlot"
     elif USE_DEPLOY_NONCE:
-        finalize_action = {
-            "type": "finalizeEvmContract",
-            "token": TOKEN,
-            "input": {"create": {"nonce": DEPLOY_NONCE}},
-        }
-        storage_slot_info = f"Deploy nonce: {DEPLOY_NONCE}"
+        finalize_input = {"create": {"nonce": DEPLOY_NONCE}}
     elif USE_FIRST_STORAGE_SLOT:
-        finalize_action = {
-            "type": "finalizeEvmContract",
-            "token": TOKEN,
-            "input": "firstStorageSlot",
-        }
-        storage_slot_info = "First storage slot"
+        finalize_input = "firstStorageSlot"
     else:
         raise Exception("Must set one of: USE_CUSTOM_STORAGE_SLOT, USE_DEPLOY_NONCE, or USE_FIRST_STORAGE_SLOT")
-    
-    # Sign the action
-    print(f"\n🔐 Signing transaction...")
-    try:
-        nonce = get_timestamp_ms()
-        signature = sign_l1_action(account, finalize_action, None, nonce, None, USE_MAINNET)
-        payload = {
-            "action": finalize_action,
-            "nonce": nonce,
-            "signature": signature,
-            "vaultAddress": None,
-        }
-        print("✅ Transaction signed successfully")
-    except Exception as e:
-        print(f"❌ ERROR: Failed to sign transaction: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    
-    # Display what will be sent
-    print("\n" + "="*80)
-    print("TRANSACTION DETAILS")
-    print("="*80)
-    print(f"API Endpoint: {API_URL}/exchange")
-    print(f"Token Index: {TOKEN}")
-    print(f"Storage Slot Method: {storage_slot_info}")
-    print(f"Nonce: {nonce}")
-    print("\nAction that will be sent:")
-    print(json.dumps(finalize_action, indent=2))
-    print("\nFull payload (signature truncated for display):")
-    payload_display = payload.copy()
-    if "signature" in payload_display:
-        sig = payload_display["signature"]
-        payload_display["signature"] = {
-            "r": sig["r"][:20] + "..." if len(sig["r"]) > 20 else sig["r"],
-            "s": sig["s"][:20] + "..." if len(sig["s"]) > 20 else sig["s"],
-            "v": sig["v"]
-        }
-    print(json.dumps(payload_display, indent=2))
-    print("="*80)
-    print("⚠️  WARNING: This action is IRREVERSIBLE!")
-    print("="*80)
-    
-    if DRY_RUN:
-        print("\n🔍 DRY RUN MODE - Transaction NOT sent")
-        print("Set DRY_RUN = False to actually send this transaction")
-    else:
-        print("\n📤 SENDING TRANSACTION...")
-        try:
-            response = requests.post(API_URL + "/exchange", json=payload, timeout=30)
-            response.raise_for_status()  # Raises an HTTPError for bad responses
-            
-            result = response.json()
-            print("\n✅ Transaction submitted successfully!")
-            print("Response:")
-            print(json.dumps(result, indent=2))
-            
-            # Check for errors in the response
-            if isinstance(result, dict):
-                if result.get("status") == "ok":
-                    print("\n✅ Status: OK - Transaction accepted")
-                    if "response" in result:
-                        print(f"Response data: {json.dumps(result['response'], indent=2)}")
-                elif result.get("status") == "err":
-                    error_msg = result.get("response", "Unknown error")
-                    print(f"\n❌ Status: ERROR - {error_msg}")
-                    if isinstance(error_msg, dict) and "data" in error_msg:
-                        print(f"Error details: {error_msg['data']}")
-                    return 1
-                else:
-                    print(f"\n⚠️  Status: {result.get('status', 'unknown')}")
-                    print("Full response:", json.dumps(result, indent=2))
-            else:
-                print(f"\n⚠️  Unexpected response format: {result}")
-                
-        except requests.exceptions.Timeout:
-            print("\n❌ ERROR: Request timed out after 30 seconds")
-            print("The transaction may have been submitted. Check your account status.")
-            return 1
-        except requests.exceptions.HTTPError as e:
-            print(f"\n❌ HTTP ERROR: {e}")
-            print(f"Status code: {response.status_code}")
-            try:
-                error_body = response.json()
-                print(f"Error response: {json.dumps(error_body, indent=2)}")
-            except:
-                print(f"Error response (text): {response.text}")
-            return 1
-        except requests.exceptions.RequestException as e:
-            print(f"\n❌ REQUEST ERROR: {e}")
-            print("Failed to send transaction. Check your network connection and API endpoint.")
-            return 1
-        except Exception as e:
-            print(f"\n❌ UNEXPECTED ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            return 1
-    
-    return 0
+    finalize_requests = [(token, finalize_input)] + EXTRA_TOKENS
+
+    print(f"\n📋 Configuration:")
+    print(f"  Account: {account.address}")
+    print(f"  API URL: {API_URL}")
+    print(f"  Token Index: {', '.join(str(token) for token, _ in finalize_requests)}")
+    print(f"  Network: {'Mainnet' if USE_MAINNET else 'Testnet'}")
+    print(f"  Mode: {'DRY RUN' if DRY_RUN else 'LIVE'}")
+
+    return asyncio.run(finalize_all(account, finalize_requests, verbose, debug))
 
 
 if __name__ == "__main__":
-    import sys
-    exit_code = main()
+    parser = argparse.ArgumentParser(description="Finalize EVM contract linking with a HyperCore spot token")
+    parser.add_argument("--verbose", action="store_true", help="print the full exchange response and tracebacks (or set HL_VERBOSE=1)")
+    parser.add_argument("--debug", action="store_true", help="print the full signed payload before sending")
+    args = parser.parse_args()
+    exit_code = main(verbose=args.verbose, debug=args.debug)
     if exit_code != 0:
         print("\n" + "="*80)
         print("❌ Script completed with errors")
@@ -3,10 +3,12 @@
 ⚠️  EDIT THE CONFIGURATION BELOW BEFORE RUNNING!
 """
 
+import argparse
+import asyncio
 import json
 import time
-from datetime import datetime, timezone
 import os
+import sys
 
 import example_utils
 
@@ -23,48 +25,39 @@ FULL_NAME = os.getenv("TOKEN_FULL_NAME", "PLACEHOLDER")  # ⚠️  CHANGE THIS:
 # ============================================================================
 
 
-def main():
-    print("=" * 60)
-    print("QUICK TOKEN BID")
-    print("=" * 60)
-    print(f"\nToken: {TOKEN_NAME}")
-    print(f"Full name: {FULL_NAME}")
-    print(f"Size decimals: {SZ_DECIMALS}")
-    print(f"Wei decimals: {WEI_DECIMALS}")
-    print(f"Max gas: {MAX_GAS} ({MAX_GAS / 1e12:.2f} HYPE)")
+async def poll_until_active(info, address, poll_interval, min_poll_interval):
+    """Poll the gas auction until the current price is at or below MAX_GAS.
 
-    # Check auction status first
-    address, info, exchange = example_utils.setup(constants.TESTNET_API_URL, skip_ws=True)
-
-    print("\n" + "=" * 60)
-    print("Checking Auction Status...")
-    print("=" * 60)
-
-    # Poll until auction is active
-    POLL_INTERVAL = 5  # Check every 5 seconds
-    AUTO_BID = True  # Set to False to require manual confirmation
+    While the price is above MAX_GAS, the wait between polls is scaled to the observed rate of decline so polling
+    is sparse early on and tightens towards min_poll_interval as the price approaches MAX_GAS.
 
+    Returns the gas auction state once the price is acceptable, or None if the auction has already completed.
+    Blocking HTTP calls run in a worker thread so several addresses can be polled concurrently with asyncio.gather.
+    """
+    # The websocket API has no channel for spotDeployState, so the auction price can only be observed by polling
+    # /info. If a push channel becomes available, subscribe through info.subscribe instead of polling here.
+    first_active = None  # (monotonic time, gas) of the first poll that saw an active auction
+    last_report = None  # monotonic time the auction status was last printed
     while True:
-        auction_status = info.query_spot_deploy_auction_status(address)
+        auction_status = await asyncio.to_thread(info.query_spot_deploy_auction_status, address)
         gas_auction = auction_status.get("gasAuction", {})
         current_gas = gas_auction.get("currentGas")
 
         if current_gas is None:
             # Check if auction hasn't started yet or has completed
-            if gas_auction.get("startTimeSeconds"):
-                start_utc = datetime.fromtimestamp(gas_auction["startTimeSeconds"], tz=timezone.utc)
-                now_utc = datetime.now(timezone.utc)
-                if now_utc < start_utc:
-                    time_until = (start_utc - now_utc).total_seconds()
+            start_ts = gas_auction.get("startTimeSeconds")
+            if start_ts:
+                time_until = start_ts - time.time()
+                if time_until > 0:
                     print(f"⏳ Auction hasn't started yet. Waiting... ({int(time_until)}s until start)")
-                    time.sleep(min(POLL_INTERVAL, time_until))
+                    await asyncio.sleep(min(poll_interval, time_until))
                     continue
                 else:
                     print("❌ Auction has completed. Wait for the next one.")
-                    return
+                    return None
             else:
                 print("⏳ Waiting for auction to start...")
-                time.sleep(POLL_INTERVAL)
+                await asyncio.sleep(poll_interval)
                 continue
         else:
             # Auction is active! Check if price is acceptable
@@ -72,59 +65,117 @@ def main():
             current_gas_float = float(current_gas)
             max_gas_float = MAX_GAS / 1e12  # Convert to HYPE
 
-            print(f"\nAuction Status:")
-            print(f"  Start gas: {start_gas} HYPE")
-            print(f"  Current gas: {current_gas_float} HYPE")
-            print(f"  Your max gas: {max_gas_float} HYPE")
-
-            if current_gas_float * 1e12 > MAX_GAS:
-                print(f"\n⏳ Price too high ({current_gas_float:.2f} HYPE > {max_gas_float:.2f} HYPE)")
-                print(f"   Waiting for price to drop... (checking every {POLL_INTERVAL}s)")
-                time.sleep(POLL_INTERVAL)
+            # Polls speed up near the crossover, so only print the status at most once per poll_interval
+            now = time.monotonic()
+            price_too_high = current_gas_float * 1e12 > MAX_GAS
+            if not price_too_high or last_report is None or now - last_report >= poll_interval:
+                last_report = now
+                print(f"\nAuction Status:")
+                print(f"  Start gas: {start_gas} HYPE")
+                print(f"  Current gas: {current_gas_float} HYPE")
+                print(f"  Your max gas: {max_gas_float} HYPE")
+                if price_too_high:
+                    print(f"\n⏳ Price too high ({current_gas_float:.2f} HYPE > {max_gas_float:.2f} HYPE)")
+                    print("   Waiting for price to drop...")
+
+            if price_too_high:
+                if first_active is None:
+                    first_active = (now, current_gas_float)
+                t0, gas0 = first_active
+                rate = (gas0 - current_gas_float) / (now - t0) if now > t0 else 0.0
+                if rate > 0:
+                    # Sleep for half the projected time until the price crosses MAX_GAS
+                    eta = (current_gas_float - max_gas_float) / rate
+                    interval = max(min_poll_interval, min(poll_interval, eta * 0.5))
+                else:
+                    interval = poll_interval
+                await asyncio.sleep(interval)
                 continue
             else:
                 # Price is acceptable!
                 print(f"\n✅ Price is acceptable! ({current_gas_float:.2f} HYPE <= {max_gas_float:.2f} HYPE)")
-                break
+                return gas_auction
+
+
+def sign_bid(exchange):
+    return exchange.sign_spot_deploy_register_token(
+        token_name=TOKEN_NAME,
+        sz_decimals=SZ_DECIMALS,
+        wei_decimals=WEI_DECIMALS,
+        max_gas=MAX_GAS,
+        full_name=FULL_NAME,
+    )
 
-    # Get final values after breaking out of loop
-    auction_status = info.query_spot_deploy_auction_status(address)
-    gas_auction = auction_status.get("gasAuction", {})
-    current_gas = gas_auction.get("currentGas")
-    current_gas_float = float(current_gas)
-    max_gas_float = MAX_GAS / 1e12
+
+async def main(debug=False):
+    print("=" * 60)
+    print("QUICK TOKEN BID")
+    print("=" * 60)
+    print(f"\nToken: {TOKEN_NAME}")
+    print(f"Full name: {FULL_NAME}")
+    print(f"Size decimals: {SZ_DECIMALS}")
+    print(f"Wei decimals: {WEI_DECIMALS}")
+    print(f"Max gas: {MAX_GAS} ({MAX_GAS / 1e12:.2f} HYPE)")
+
+    # Check auction status first
+    address, info, exchange = example_utils.setup(constants.TESTNET_API_URL, skip_ws=True)
 
     print("\n" + "=" * 60)
-    print("✅ Auction is ACTIVE - Ready to Bid!")
+    print("Checking Auction Status...")
     print("=" * 60)
-    print(f"\nYou will bid on ticker: {TOKEN_NAME}")
-    print(f"Max gas: {max_gas_float} HYPE")
-    print(f"Current gas: {current_gas_float} HYPE")
+
+    # Poll until auction is active
+    POLL_INTERVAL = 5  # Check at most every 5 seconds
+    MIN_POLL_INTERVAL = 0.25  # Fastest polling rate as the price approaches MAX_GAS
+    AUTO_BID = True  # Set to False to require manual confirmation
+
+    gas_auction = await poll_until_active(info, address, POLL_INTERVAL, MIN_POLL_INTERVAL)
+    if gas_auction is None:
+        return
+
+    # Reuse the state from the last poll rather than querying again right before bidding
+    current_gas_float = float(gas_auction["currentGas"])
+    max_gas_float = MAX_GAS / 1e12
+
+    # Emit the banner with a single write so console output stays off the bidding path
+    lines = [
+        "\n" + "=" * 60,
+        "✅ Auction is ACTIVE - Ready to Bid!",
+        "=" * 60,
+        f"\nYou will bid on ticker: {TOKEN_NAME}",
+        f"Max gas: {max_gas_float} HYPE",
+        f"Current gas: {current_gas_float} HYPE",
+    ]
+    if AUTO_BID:
+        lines += ["\n⚠️  AUTO-BID ENABLED - Bidding automatically in 3 seconds...", "   (Press Ctrl+C to cancel)"]
+    else:
+        lines += ["\n⚠️  This will participate in the auction NOW!"]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     if AUTO_BID:
-        print("\n⚠️  AUTO-BID ENABLED - Bidding automatically in 3 seconds...")
-        print("   (Press Ctrl+C to cancel)")
-        time.sleep(3)
+        # Sign during the countdown so only the POST is left once the monotonic deadline passes
+        deadline = time.monotonic_ns() + 3_000_000_000
+        signed_bid = sign_bid(exchange)
+        while (remaining_ns := deadline - time.monotonic_ns()) > 0:
+            await asyncio.sleep(min(0.05, remaining_ns / 1e9))
     else:
-        print("\n⚠️  This will participate in the auction NOW!")
         response = input("Proceed with bid? (yes/no): ")
         if response.lower() != "yes":
             print("Cancelled.")
             return
+        signed_bid = sign_bid(exchange)
 
     print("\nSubmitting bid...")
-    result = exchange.spot_deploy_register_token(
-        token_name=TOKEN_NAME,
-        sz_decimals=SZ_DECIMALS,
-        wei_decimals=WEI_DECIMALS,
-        max_gas=MAX_GAS,
-        full_name=FULL_NAME,
-    )
+    result = exchange.post_signed_action(signed_bid)
 
     print("\n" + "=" * 60)
     print("RESULT")
     print("=" * 60)
-    print(json.dumps(result, indent=2))
+    if debug:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Status: {result['status']}")
 
     if result["status"] == "ok":
         token_index = result["response"]["data"]
@@ -134,10 +185,12 @@ def main():
         print("\n⚠️  IMPORTANT: Save this token index ({})!".format(token_index))
         print("   You'll need it for genesis and other steps.")
     else:
-        print("\n❌ Bid failed. Check the error above.")
+        print(f"\n❌ Bid failed: {result.get('response')}")
 
 
 if __name__ == "__main__":
-    main()
-    
+    parser = argparse.ArgumentParser(description="quick_bid_token")
+    parser.add_argument("--debug", action="store_true", help="print the full exchange response")
+    args = parser.parse_args()
+    asyncio.run(main(debug=args.debug))
 
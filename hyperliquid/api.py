@@ -6,13 +6,19 @@ import requests
 
 from hyperliquid.utils.constants import MAINNET_API_URL
 from hyperliquid.utils.error import ClientError, ServerError
-from hyperliquid.utils.types import Any
+from hyperliquid.utils.types import Any, Optional
 
 
 class API:
-    def __init__(self, base_url=None, timeout=None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.base_url = base_url or MAINNET_API_URL
-        self.session = requests.Session()
+        # Passing the same session to several clients lets them share one keep-alive connection pool
+        self.session = session or requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
         self._logger = logging.getLogger(__name__)
         self.timeout = timeout
@@ -3,6 +3,7 @@ import logging
 import secrets
 
 import eth_account
+import requests
 from eth_account.signers.local import LocalAccount
 
 from hyperliquid.api import API
@@ -44,6 +45,7 @@ from hyperliquid.utils.types import (
     Meta,
     Optional,
     PerpDexSchemaInput,
+    SignedAction,
     SpotMeta,
     Tuple,
 )
@@ -67,12 +69,13 @@ class Exchange(API):
         spot_meta: Optional[SpotMeta] = None,
         perp_dexs: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
     ):
-        super().__init__(base_url, timeout)
+        super().__init__(base_url, timeout, session)
         self.wallet = wallet
         self.vault_address = vault_address
         self.account_address = account_address
-        self.info = Info(base_url, True, meta, spot_meta, perp_dexs, timeout)
+        self.info = Info(base_url, True, meta, spot_meta, perp_dexs, timeout, self.session)
         self.expires_after: Optional[int] = None
 
     def _post_action(self, action, signature, nonce):
@@ -662,6 +665,15 @@ class Exchange(API):
     def spot_deploy_register_token(
         self, token_name: str, sz_decimals: int, wei_decimals: int, max_gas: int, full_name: str
     ) -> Any:
+        return self.post_signed_action(
+            self.sign_spot_deploy_register_token(token_name, sz_decimals, wei_decimals, max_gas, full_name)
+        )
+
+    # Signs a registerToken2 action without sending it, so latency-sensitive callers (e.g. auction bidders) can sign
+    # ahead of time and only send it once ready. Send the result with post_signed_action.
+    def sign_spot_deploy_register_token(
+        self, token_name: str, sz_decimals: int, wei_decimals: int, max_gas: int, full_name: str
+    ) -> SignedAction:
         timestamp = get_timestamp_ms()
         action = {
             "type": "spotDeploy",
@@ -671,19 +683,21 @@ class Exchange(API):
                 "fullName": full_name,
             },
         }
-        signature = sign_l1_action(
+        return {"action": action, "signature": self._sign_spot_deploy_action(action, timestamp), "nonce": timestamp}
+
+    def post_signed_action(self, signed_action: SignedAction) -> Any:
+        return self._post_action(signed_action["action"], signed_action["signature"], signed_action["nonce"])
+
+    # spotDeploy actions are never signed on behalf of a vault, so no active pool is passed
+    def _sign_spot_deploy_action(self, action: Any, nonce: int) -> Any:
+        return sign_l1_action(
             self.wallet,
             action,
             None,
-            timestamp,
+            nonce,
             self.expires_after,
             self.base_url == MAINNET_API_URL,
         )
-        return self._post_action(
-            action,
-            signature,
-            timestamp,
-        )
 
     def spot_deploy_user_genesis(
         self, token: int, user_and_wei: List[Tuple[str, str]], existing_token_and_wei: List[Tuple[int, str]]
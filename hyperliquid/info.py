@@ -1,3 +1,5 @@
+import requests
+
 from hyperliquid.api import API
 from hyperliquid.utils.types import (
     Any,
@@ -25,8 +27,9 @@ class Info(API):
         # the original dex.
         perp_dexs: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
     ):  # pylint: disable=too-many-locals
-        super().__init__(base_url, timeout)
+        super().__init__(base_url, timeout, session)
         self.ws_manager: Optional[WebsocketManager] = None
         if not skip_ws:
             self.ws_manager = WebsocketManager(self.base_url)
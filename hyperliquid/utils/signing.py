@@ -5,7 +5,7 @@ from decimal import Decimal
 
 import msgpack
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage, encode_typed_data
 from eth_utils import keccak, to_hex
 
 from hyperliquid.utils.types import Cloid, Literal, NotRequired, Optional, TypedDict, Union
@@ -145,6 +145,18 @@ MULTI_SIG_ENVELOPE_SIGN_TYPES = [
 ]
 
 
+# The L1 signing domain is identical on mainnet and testnet (the phantom agent source differs instead), so its
+# EIP-712 hash and the Agent type hash are computed once at import time rather than on every signature.
+L1_DOMAIN_HASH = keccak(
+    keccak(b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+    + keccak(b"Exchange")
+    + keccak(b"1")
+    + (1337).to_bytes(32, "big")
+    + bytes(32)
+)
+AGENT_TYPE_HASH = keccak(b"Agent(string source,bytes32 connectionId)")
+
+
 def order_type_to_wire(order_type: OrderType) -> OrderTypeWire:
     if "limit" in order_type:
         return {"limit": order_type["limit"]}
@@ -206,6 +218,12 @@ def l1_payload(phantom_agent):
     }
 
 
+def l1_signable_message(phantom_agent):
+    # Equivalent to encode_typed_data(full_message=l1_payload(phantom_agent)) using the precomputed domain hash
+    body = keccak(AGENT_TYPE_HASH + keccak(text=phantom_agent["source"]) + phantom_agent["connectionId"])
+    return SignableMessage(b"\x01", L1_DOMAIN_HASH, body)
+
+
 def user_signed_payload(primary_type, payload_types, action):
     chain_id = int(action["signatureChainId"], 16)
     return {
@@ -232,8 +250,8 @@ def user_signed_payload(primary_type, payload_types, action):
 def sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet):
     hash = action_hash(action, active_pool, nonce, expires_after)
     phantom_agent = construct_phantom_agent(hash, is_mainnet)
-    data = l1_payload(phantom_agent)
-    return sign_inner(wallet, data)
+    signed = wallet.sign_message(l1_signable_message(phantom_agent))
+    return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
 
 
 def sign_user_signed_action(wallet, action, payload_types, primary_type, is_mainnet):
@@ -440,8 +458,7 @@ def sign_inner(wallet, data):
 def recover_agent_or_user_from_l1_action(action, signature, active_pool, nonce, expires_after, is_mainnet):
     hash = action_hash(action, active_pool, nonce, expires_after)
     phantom_agent = construct_phantom_agent(hash, is_mainnet)
-    data = l1_payload(phantom_agent)
-    structured_data = encode_typed_data(full_message=data)
+    structured_data = l1_signable_message(phantom_agent)
     address = Account.recover_message(structured_data, vrs=[signature["v"], signature["r"], signature["s"]])
     return address
 
@@ -184,6 +184,8 @@ WsMsg = Union[
 # b is the public address of the builder, f is the amount of the fee in tenths of basis points. e.g. 10 means 1 basis point
 BuilderInfo = TypedDict("BuilderInfo", {"b": str, "f": int})
 
+SignedAction = TypedDict("SignedAction", {"action": Any, "signature": Any, "nonce": int})
+
 PerpDexSchemaInput = TypedDict(
     "PerpDexSchemaInput", {"fullName": str, "collateralToken": int, "oracleUpdater": Optional[str]}
 )
@@ -0,0 +1,36 @@
+import eth_account
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.utils import constants
+from hyperliquid.utils.signing import sign_l1_action
+from hyperliquid.utils.types import Meta, SpotMeta
+
+TEST_META: Meta = {"universe": []}
+TEST_SPOT_META: SpotMeta = {"universe": [], "tokens": []}
+
+
+def test_spot_deploy_register_token_signature_matches(monkeypatch):
+    wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+    exchange = Exchange(wallet, constants.TESTNET_API_URL, meta=TEST_META, spot_meta=TEST_SPOT_META)
+    posted = []
+    monkeypatch.setattr("hyperliquid.exchange.get_timestamp_ms", lambda: 1700000000000)
+    monkeypatch.setattr(exchange, "post", lambda url_path, payload: posted.append(payload))
+
+    exchange.spot_deploy_register_token("TEST", 2, 8, 10**16, "Test Token")
+
+    action = {
+        "type": "spotDeploy",
+        "registerToken2": {
+            "spec": {"name": "TEST", "szDecimals": 2, "weiDecimals": 8},
+            "maxGas": 10**16,
+            "fullName": "Test Token",
+        },
+    }
+    assert posted[0]["action"] == action
+    assert posted[0]["nonce"] == 1700000000000
+    assert posted[0]["signature"] == sign_l1_action(wallet, action, None, 1700000000000, None, False)
+
+    signed_action = exchange.sign_spot_deploy_register_token("TEST", 2, 8, 10**16, "Test Token")
+    assert signed_action == {"action": action, "signature": posted[0]["signature"], "nonce": 1700000000000}
+    exchange.post_signed_action(signed_action)
+    assert posted[1] == posted[0]
@@ -7,6 +7,13 @@ TEST_META: Meta = {"universe": []}
 TEST_SPOT_META: SpotMeta = {"universe": [], "tokens": []}
 
 
+def test_shared_session():
+    info = Info(skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META)
+    other = Info(skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META, session=info.session)
+    assert other.session is info.session
+    assert other.session.headers["Content-Type"] == "application/json"
+
+
 @pytest.mark.vcr()
 def test_get_user_state():
     info = Info(skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META)
@@ -1,5 +1,6 @@
 import eth_account
 import pytest
+from eth_account.messages import encode_typed_data
 from eth_utils import to_hex
 
 from hyperliquid.utils.signing import (
@@ -8,6 +9,8 @@ from hyperliquid.utils.signing import (
     action_hash,
     construct_phantom_agent,
     float_to_int_for_hashing,
+    l1_payload,
+    l1_signable_message,
     order_request_to_order_wire,
     order_wires_to_order_action,
     sign_l1_action,
@@ -47,6 +50,14 @@ def test_l1_action_signing_matches():
     assert signature_testnet["v"] == 28
 
 
+def test_l1_signable_message_matches_encoded_typed_data():
+    action = {"type": "dummy", "num": float_to_int_for_hashing(1000)}
+    hash = action_hash(action, None, 0, None)
+    for is_mainnet in [True, False]:
+        phantom_agent = construct_phantom_agent(hash, is_mainnet)
+        assert l1_signable_message(phantom_agent) == encode_typed_data(full_message=l1_payload(phantom_agent))
+
+
 def test_l1_action_signing_order_matches():
     wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
     order_request: OrderRequest = {